@@ -11,6 +11,9 @@ import { registerCreateEvent } from "./tools/create-event.js"
 import { registerDeleteEvent } from "./tools/delete-event.js"
 import { registerListCalendars } from "./tools/list-calendars.js"
 import { registerListEvents } from "./tools/list-events.js"
+import { registerListEventsMulti } from "./tools/list-events-multi.js"
+import { parseAccounts } from "./utils/account-config.js"
+import type { AccountConfig } from "./utils/account-config.js"
 
 const PORT = parseInt(process.env.PORT || "8000", 10)
 const HOST = process.env.HOST || "0.0.0.0"
@@ -27,45 +30,33 @@ export interface CalDAVAccount {
   calendars: CalendarInfo[] // Calendars belonging to this account
 }
 
-function parseAccounts(): Array<{
-  name: string
-  baseUrl: string
-  username: string
-  password: string
-}> {
-  const accounts: Array<{
-    name: string
-    baseUrl: string
-    username: string
-    password: string
-  }> = []
-
-  // Support numbered accounts: CALDAV_1_*, CALDAV_2_*, etc.
-  for (let i = 1; i <= 10; i++) {
-    const prefix = `CALDAV_${i}_`
-    const baseUrl = process.env[`${prefix}BASE_URL`]
-    const username = process.env[`${prefix}USERNAME`]
-    const password = process.env[`${prefix}PASSWORD`]
-    const name = process.env[`${prefix}NAME`] || `Account ${i}`
-
-    if (baseUrl && username && password) {
-      accounts.push({ name, baseUrl, username, password })
-    }
-  }
-
-  // Fallback to legacy single account format
-  if (accounts.length === 0) {
-    const baseUrl = process.env.CALDAV_BASE_URL
-    const username = process.env.CALDAV_USERNAME
-    const password = process.env.CALDAV_PASSWORD
-    const name = process.env.CALDAV_NAME || "Default"
+async function connectAccount(config: AccountConfig): Promise<CalDAVAccount> {
+  console.log(
+    `Connecting to CalDAV account: ${config.name} (${config.baseUrl})`,
+  )
+  const client = await CalDAVClient.create({
+    baseUrl: config.baseUrl,
+    auth: {
+      type: "basic",
+      username: config.username,
+      password: config.password,
+    },
+  })
 
-    if (baseUrl && username && password) {
-      accounts.push({ name, baseUrl, username, password })
-    }
+  // Fetch calendars to know which belong to this account
+  const fetchedCalendars = await client.getCalendars()
+  const calendars = fetchedCalendars.map((c) => ({
+    name: c.displayName,
+    url: c.url,
+  }))
+
+  console.log(`Connected to ${config.name} (${calendars.length} calendars)`)
+  return {
+    name: config.name,
+    client,
+    baseUrl: config.baseUrl,
+    calendars,
   }
-
-  return accounts
 }
 
 async function createClients(): Promise<CalDAVAccount[]> {
@@ -77,35 +68,24 @@ async function createClients(): Promise<CalDAVAccount[]> {
     )
   }
 
+  // Connect to all accounts concurrently; one unreachable server should
+  // neither delay nor prevent the others from being used
+  const results = await Promise.allSettled(accountConfigs.map(connectAccount))
+
   const accounts: CalDAVAccount[] = []
+  results.forEach((result, i) => {
+    if (result.status === "fulfilled") {
+      accounts.push(result.value)
+    } else {
+      console.error(
+        `Failed to connect to ${accountConfigs[i].name}:`,
+        result.reason,
+      )
+    }
+  })
 
-  for (const config of accountConfigs) {
-    console.log(
-      `Connecting to CalDAV account: ${config.name} (${config.baseUrl})`,
-    )
-    const client = await CalDAVClient.create({
-      baseUrl: config.baseUrl,
-      auth: {
-        type: "basic",
-        username: config.username,
-        password: config.password,
-      },
-    })
-
-    // Fetch calendars to know which belong to this account
-    const fetchedCalendars = await client.getCalendars()
-    const calendars = fetchedCalendars.map((c) => ({
-      name: c.displayName,
-      url: c.url,
-    }))
-
-    accounts.push({
-      name: config.name,
-      client,
-      baseUrl: config.baseUrl,
-      calendars,
-    })
-    console.log(`Connected to ${config.name} (${calendars.length} calendars)`)
+  if (accounts.length === 0) {
+    throw new Error("Could not connect to any configured CalDAV account.")
   }
 
   return accounts
@@ -119,6 +99,7 @@ async function createMcpServer(accounts: CalDAVAccount[]): Promise<McpServer> {
 
   registerCreateEvent(accounts, server)
   registerListEvents(accounts, server)
+  registerListEventsMulti(accounts, server)
   registerDeleteEvent(accounts, server)
   await registerListCalendars(accounts, server)
 
@@ -151,6 +132,9 @@ async function runHTTP(accounts: CalDAVAccount[]) {
         sessionIdGenerator: undefined, // Stateless mode
       })
 
+      // Ask reverse proxies (e.g. nginx) not to buffer SSE responses
+      res.setHeader("X-Accel-Buffering", "no")
+
       await server.connect(transport)
       await transport.handleRequest(req, res)
       return
@@ -159,6 +143,11 @@ async function runHTTP(accounts: CalDAVAccount[]) {
     res.writeHead(404).end("Not found")
   })
 
+  // Keep idle client connections open across tool calls; Node's 5s default
+  // closes them between most calls. Stay above common proxy idle timeouts.
+  httpServer.keepAliveTimeout = 65 * 1000
+  httpServer.headersTimeout = 66 * 1000
+
   httpServer.listen(PORT, HOST, () => {
     console.log(`CalDAV MCP server running on http://${HOST}:${PORT}`)
     console.log(`MCP endpoint: http://${HOST}:${PORT}/mcp`)
@@ -1,5 +1,91 @@
-import { describe, test } from "vitest"
+/* eslint-disable @typescript-eslint/no-explicit-any */
+import { describe, test, expect, vi, beforeEach } from "vitest"
+import { registerCreateEvent } from "./create-event.js"
+import { registerListEvents } from "./list-events.js"
+import { McpServer } from "@modelcontextprotocol/sdk/server/mcp.js"
+import type { CalDAVAccount } from "../index.js"
 
 describe("registerCreateEvent", () => {
-  test("to be implemented", () => {})
+  const calendarUrl = "https://caldav.example.com/calendars/test/calendar1"
+  const listArgs = {
+    calendarUrl,
+    start: "2025-01-01T00:00:00Z",
+    end: "2025-01-31T23:59:59Z",
+  }
+  const createArgs = {
+    calendarUrl,
+    summary: "New Event",
+    start: "2025-01-15T10:00:00Z",
+    end: "2025-01-15T11:00:00Z",
+  }
+
+  let mockServer: McpServer
+  let mockAccounts: CalDAVAccount[]
+  let handlers: Record<string, any>
+
+  beforeEach(() => {
+    handlers = {}
+    mockServer = {
+      tool: vi.fn((name, description, schema, handler) => {
+        handlers[name] = handler
+      }),
+    } as any
+
+    mockAccounts = [
+      {
+        name: "Test Account",
+        client: {
+          getEvents: vi.fn().mockResolvedValue([]),
+          getCtag: vi.fn().mockResolvedValue("ctag-1"),
+          createEvent: vi.fn().mockResolvedValue({ uid: "new-uid" }),
+        } as any,
+        baseUrl: "https://caldav.example.com",
+        calendars: [{ name: "Test Calendar", url: calendarUrl }],
+      },
+    ]
+
+    registerListEvents(mockAccounts, mockServer)
+    registerCreateEvent(mockAccounts, mockServer)
+  })
+
+  test("should create the event and return its UID", async () => {
+    const result = await handlers["create-event"](createArgs)
+
+    expect(result.isError).toBeUndefined()
+    expect(result.content[0].text).toBe("new-uid")
+    expect(mockAccounts[0].client.createEvent).toHaveBeenCalledWith(
+      calendarUrl,
+      expect.objectContaining({
+        summary: "New Event",
+        start: new Date("2025-01-15T10:00:00Z"),
+        end: new Date("2025-01-15T11:00:00Z"),
+      }),
+    )
+  })
+
+  test("should make list-events refetch after creating an event", async () => {
+    const getEvents = mockAccounts[0].client.getEvents
+
+    // The second listing is served from cache
+    await handlers["list-events"](listArgs)
+    await handlers["list-events"](listArgs)
+    expect(getEvents).toHaveBeenCalledTimes(1)
+
+    await handlers["create-event"](createArgs)
+    await handlers["list-events"](listArgs)
+
+    expect(getEvents).toHaveBeenCalledTimes(2)
+  })
+
+  test("should return error when calendar URL not found", async () => {
+    const result = await handlers["create-event"]({
+      ...createArgs,
+      calendarUrl: "https://caldav.example.com/calendars/nonexistent",
+    })
+
+    expect(result.isError).toBe(true)
+    expect(result.content[0].text).toContain(
+      "No account found for calendar URL",
+    )
+  })
 })
@@ -2,6 +2,9 @@ import { RecurrenceRule } from "ts-caldav"
 import { z } from "zod"
 import { McpServer } from "@modelcontextprotocol/sdk/server/mcp.js"
 import type { CalDAVAccount } from "../index.js"
+import { findAccountForCalendarUrl } from "../utils/accounts.js"
+import { withAccountLimit } from "../utils/concurrency.js"
+import { invalidateCalendar } from "../utils/event-cache.js"
 
 const recurrenceRuleSchema = z.object({
   freq: z.enum(["DAILY", "WEEKLY", "MONTHLY", "YEARLY"]).optional(),
@@ -13,15 +16,6 @@ const recurrenceRuleSchema = z.object({
   bymonth: z.array(z.number()).optional(),
 })
 
-function findAccountForCalendarUrl(
-  accounts: CalDAVAccount[],
-  calendarUrl: string,
-): CalDAVAccount | undefined {
-  return accounts.find((account) =>
-    account.calendars.some((c) => c.url === calendarUrl),
-  )
-}
-
 export function registerCreateEvent(
   accounts: CalDAVAccount[],
   server: McpServer,
@@ -61,12 +55,15 @@ export function registerCreateEvent(
       console.log(`[create-event] Found account: ${account.name}`)
 
       try {
-        const event = await account.client.createEvent(calendarUrl, {
-          summary: summary,
-          start: new Date(start),
-          end: new Date(end),
-          recurrenceRule: recurrenceRule as RecurrenceRule,
-        })
+        const event = await withAccountLimit(account, () =>
+          account.client.createEvent(calendarUrl, {
+            summary: summary,
+            start: new Date(start),
+            end: new Date(end),
+            recurrenceRule: recurrenceRule as RecurrenceRule,
+          }),
+        )
+        invalidateCalendar(account, calendarUrl)
         console.log(`[create-event] Created event with UID: ${event.uid}`)
         return {
           content: [{ type: "text", text: event.uid }],
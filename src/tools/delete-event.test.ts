@@ -0,0 +1,85 @@
+/* eslint-disable @typescript-eslint/no-explicit-any */
+import { describe, test, expect, vi, beforeEach } from "vitest"
+import { registerDeleteEvent } from "./delete-event.js"
+import { registerListEvents } from "./list-events.js"
+import { McpServer } from "@modelcontextprotocol/sdk/server/mcp.js"
+import type { CalDAVAccount } from "../index.js"
+
+describe("registerDeleteEvent", () => {
+  const calendarUrl = "https://caldav.example.com/calendars/test/calendar1"
+  const listArgs = {
+    calendarUrl,
+    start: "2025-01-01T00:00:00Z",
+    end: "2025-01-31T23:59:59Z",
+  }
+
+  let mockServer: McpServer
+  let mockAccounts: CalDAVAccount[]
+  let handlers: Record<string, any>
+
+  beforeEach(() => {
+    handlers = {}
+    mockServer = {
+      tool: vi.fn((name, description, schema, handler) => {
+        handlers[name] = handler
+      }),
+    } as any
+
+    mockAccounts = [
+      {
+        name: "Test Account",
+        client: {
+          getEvents: vi.fn().mockResolvedValue([]),
+          getCtag: vi.fn().mockResolvedValue("ctag-1"),
+          deleteEvent: vi.fn().mockResolvedValue(undefined),
+        } as any,
+        baseUrl: "https://caldav.example.com",
+        calendars: [{ name: "Test Calendar", url: calendarUrl }],
+      },
+    ]
+
+    registerListEvents(mockAccounts, mockServer)
+    registerDeleteEvent(mockAccounts, mockServer)
+  })
+
+  test("should delete the event by UID", async () => {
+    const result = await handlers["delete-event"]({
+      uid: "event-1",
+      calendarUrl,
+    })
+
+    expect(result.isError).toBeUndefined()
+    expect(mockAccounts[0].client.deleteEvent).toHaveBeenCalledWith(
+      calendarUrl,
+      "event-1",
+    )
+  })
+
+  test("should make list-events refetch after deleting an event", async () => {
+    const getEvents = mockAccounts[0].client.getEvents
+
+    // The second listing is served from cache
+    await handlers["list-events"](listArgs)
+    await handlers["list-events"](listArgs)
+    expect(getEvents).toHaveBeenCalledTimes(1)
+
+    await handlers["delete-event"]({ uid: "event-1", calendarUrl })
+    await handlers["list-events"](listArgs)
+
+    expect(getEvents).toHaveBeenCalledTimes(2)
+  })
+
+  test("should handle CalDAV client errors gracefully", async () => {
+    mockAccounts[0].client.deleteEvent = vi
+      .fn()
+      .mockRejectedValue(new Error("Event not found"))
+
+    const result = await handlers["delete-event"]({
+      uid: "event-1",
+      calendarUrl,
+    })
+
+    expect(result.isError).toBe(true)
+    expect(result.content[0].text).toContain("Event not found")
+  })
+})
@@ -1,15 +1,9 @@
 import { z } from "zod"
 import { McpServer } from "@modelcontextprotocol/sdk/server/mcp.js"
 import type { CalDAVAccount } from "../index.js"
-
-function findAccountForCalendarUrl(
-  accounts: CalDAVAccount[],
-  calendarUrl: string,
-): CalDAVAccount | undefined {
-  return accounts.find((account) =>
-    account.calendars.some((c) => c.url === calendarUrl),
-  )
-}
+import { findAccountForCalendarUrl } from "../utils/accounts.js"
+import { withAccountLimit } from "../utils/concurrency.js"
+import { invalidateCalendar } from "../utils/event-cache.js"
 
 export function registerDeleteEvent(
   accounts: CalDAVAccount[],
@@ -41,7 +35,10 @@ export function registerDeleteEvent(
       console.log(`[delete-event] Found account: ${account.name}`)
 
       try {
-        await account.client.deleteEvent(calendarUrl, uid)
+        await withAccountLimit(account, () =>
+          account.client.deleteEvent(calendarUrl, uid),
+        )
+        invalidateCalendar(account, calendarUrl)
         console.log(`[delete-event] Deleted event: ${uid}`)
         return {
           content: [{ type: "text", text: "Event deleted" }],
@@ -1,22 +1,37 @@
 import { McpServer } from "@modelcontextprotocol/sdk/server/mcp.js"
 import type { CalDAVAccount } from "../index.js"
 
+// Calendars are fetched once at startup, so the listing never changes
+// for a given accounts list; HTTP mode registers tools on every request
+const calendarListings = new WeakMap<CalDAVAccount[], string>()
+
+function getCalendarListing(accounts: CalDAVAccount[]): string {
+  let listing = calendarListings.get(accounts)
+  if (listing === undefined) {
+    const allCalendars: Array<{ account: string; name: string; url: string }> =
+      []
+
+    for (const account of accounts) {
+      for (const cal of account.calendars) {
+        allCalendars.push({
+          account: account.name,
+          name: cal.name,
+          url: cal.url,
+        })
+      }
+    }
+
+    listing = JSON.stringify(allCalendars, null, 2)
+    calendarListings.set(accounts, listing)
+  }
+  return listing
+}
+
 export async function registerListCalendars(
   accounts: CalDAVAccount[],
   server: McpServer,
 ) {
-  // Use pre-fetched calendars from accounts
-  const allCalendars: Array<{ account: string; name: string; url: string }> = []
-
-  for (const account of accounts) {
-    for (const cal of account.calendars) {
-      allCalendars.push({
-        account: account.name,
-        name: cal.name,
-        url: cal.url,
-      })
-    }
-  }
+  const listing = getCalendarListing(accounts)
 
   server.tool(
     "list-calendars",
@@ -24,9 +39,7 @@ export async function registerListCalendars(
     {},
     async () => {
       return {
-        content: [
-          { type: "text", text: JSON.stringify(allCalendars, null, 2) },
-        ],
+        content: [{ type: "text", text: listing }],
       }
     },
   )
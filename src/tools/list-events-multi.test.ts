@@ -0,0 +1,290 @@
+/* eslint-disable @typescript-eslint/no-explicit-any */
+import { describe, test, expect, vi, beforeEach } from "vitest"
+import { registerListEventsMulti } from "./list-events-multi.js"
+import { McpServer } from "@modelcontextprotocol/sdk/server/mcp.js"
+import type { CalDAVAccount } from "../index.js"
+
+describe("registerListEventsMulti", () => {
+  let mockServer: McpServer
+  let mockAccounts: CalDAVAccount[]
+  let mockExtra: any
+  let registeredToolHandler: any
+
+  beforeEach(() => {
+    mockExtra = { sendNotification: vi.fn().mockResolvedValue(undefined) }
+    mockServer = {
+      tool: vi.fn((name, description, schema, handler) => {
+        registeredToolHandler = (args: any) => handler(args, mockExtra)
+      }),
+    } as any
+
+    mockAccounts = [
+      {
+        name: "Account 1",
+        client: { getEvents: vi.fn().mockResolvedValue([]) } as any,
+        baseUrl: "https://cal1.example.com",
+        calendars: [
+          { name: "Work", url: "https://cal1.example.com/work" },
+          { name: "Team", url: "https://cal1.example.com/team" },
+        ],
+      },
+      {
+        name: "Account 2",
+        client: { getEvents: vi.fn().mockResolvedValue([]) } as any,
+        baseUrl: "https://cal2.example.com",
+        calendars: [{ name: "Home", url: "https://cal2.example.com/home" }],
+      },
+    ]
+  })
+
+  test("should register list-events-multi tool with correct parameters", () => {
+    registerListEventsMulti(mockAccounts, mockServer)
+
+    expect(mockServer.tool).toHaveBeenCalledWith(
+      "list-events-multi",
+      expect.stringContaining("across several calendars"),
+      expect.objectContaining({
+        calendarUrls: expect.anything(),
+        start: expect.anything(),
+        end: expect.anything(),
+      }),
+      expect.any(Function),
+    )
+  })
+
+  test("should fetch every calendar with its own account", async () => {
+    registerListEventsMulti(mockAccounts, mockServer)
+
+    await registeredToolHandler({
+      calendarUrls: [
+        "https://cal1.example.com/work",
+        "https://cal2.example.com/home",
+      ],
+      start: "2025-01-01T00:00:00Z",
+      end: "2025-01-31T00:00:00Z",
+    })
+
+    const options = {
+      start: new Date("2025-01-01T00:00:00Z"),
+      end: new Date("2025-01-31T00:00:00Z"),
+    }
+    expect(mockAccounts[0].client.getEvents).toHaveBeenCalledTimes(1)
+    expect(mockAccounts[0].client.getEvents).toHaveBeenCalledWith(
+      "https://cal1.example.com/work",
+      options,
+    )
+    expect(mockAccounts[1].client.getEvents).toHaveBeenCalledWith(
+      "https://cal2.example.com/home",
+      options,
+    )
+  })
+
+  test("should fetch calendars concurrently", async () => {
+    let inFlight = 0
+    let maxInFlight = 0
+    const slowGetEvents = vi.fn(async () => {
+      inFlight++
+      maxInFlight = Math.max(maxInFlight, inFlight)
+      await new Promise((resolve) => setTimeout(resolve, 10))
+      inFlight--
+      return []
+    })
+    mockAccounts[0].client.getEvents = slowGetEvents
+    mockAccounts[1].client.getEvents = slowGetEvents
+
+    registerListEventsMulti(mockAccounts, mockServer)
+
+    await registeredToolHandler({
+      calendarUrls: [
+        "https://cal1.example.com/work",
+        "https://cal1.example.com/team",
+        "https://cal2.example.com/home",
+      ],
+      start: "2025-01-01T00:00:00Z",
+    })
+
+    expect(slowGetEvents).toHaveBeenCalledTimes(3)
+    expect(maxInFlight).toBe(3)
+  })
+
+  test("should merge events sorted by start and tagged with their calendar", async () => {
+    mockAccounts[0].client.getEvents = vi.fn().mockResolvedValue([
+      {
+        uid: "work-1",
+        summary: "Work Later",
+        start: new Date("2025-01-20T10:00:00Z"),
+        end: new Date("2025-01-20T11:00:00Z"),
+      },
+    ])
+    mockAccounts[1].client.getEvents = vi.fn().mockResolvedValue([
+      {
+        uid: "home-1",
+        summary: "Home Earlier",
+        start: new Date("2025-01-10T10:00:00Z"),
+        end: new Date("2025-01-10T11:00:00Z"),
+      },
+    ])
+
+    registerListEventsMulti(mockAccounts, mockServer)
+
+    const result = await registeredToolHandler({
+      calendarUrls: [
+        "https://cal1.example.com/work",
+        "https://cal2.example.com/home",
+      ],
+      start: "2025-01-01T00:00:00Z",
+      end: "2025-01-31T23:59:59Z",
+    })
+
+    expect(result.isError).toBeUndefined()
+    const responseData = JSON.parse(result.content[0].text)
+    expect(responseData).toEqual([
+      {
+        calendarUrl: "https://cal2.example.com/home",
+        summary: "Home Earlier",
+        start: "2025-01-10T10:00:00.000Z",
+        end: "2025-01-10T11:00:00.000Z",
+        isRecurring: false,
+      },
+      {
+        calendarUrl: "https://cal1.example.com/work",
+        summary: "Work Later",
+        start: "2025-01-20T10:00:00.000Z",
+        end: "2025-01-20T11:00:00.000Z",
+        isRecurring: false,
+      },
+    ])
+  })
+
+  test("should report progress per calendar when a progress token is given", async () => {
+    mockExtra._meta = { progressToken: "token-1" }
+    registerListEventsMulti(mockAccounts, mockServer)
+
+    await registeredToolHandler({
+      calendarUrls: [
+        "https://cal1.example.com/work",
+        "https://cal2.example.com/home",
+      ],
+      start: "2025-01-01T00:00:00Z",
+    })
+
+    expect(mockExtra.sendNotification).toHaveBeenCalledTimes(2)
+    expect(mockExtra.sendNotification).toHaveBeenLastCalledWith({
+      method: "notifications/progress",
+      params: { progressToken: "token-1", progress: 2, total: 2 },
+    })
+  })
+
+  test("should return events even when sending progress fails", async () => {
+    mockExtra._meta = { progressToken: "token-1" }
+    mockExtra.sendNotification = vi
+      .fn()
+      .mockRejectedValue(new Error("Not connected"))
+    mockAccounts[0].client.getEvents = vi.fn().mockResolvedValue([
+      {
+        uid: "work-1",
+        summary: "Team Meeting",
+        start: new Date("2025-01-15T10:00:00Z"),
+        end: new Date("2025-01-15T11:00:00Z"),
+      },
+    ])
+    registerListEventsMulti(mockAccounts, mockServer)
+
+    const result = await registeredToolHandler({
+      calendarUrls: ["https://cal1.example.com/work"],
+      start: "2025-01-01T00:00:00Z",
+    })
+
+    expect(mockExtra.sendNotification).toHaveBeenCalled()
+    expect(result.isError).toBeUndefined()
+    expect(JSON.parse(result.content[0].text)).toHaveLength(1)
+  })
+
+  test("should not send progress without a progress token", async () => {
+    registerListEventsMulti(mockAccounts, mockServer)
+
+    await registeredToolHandler({
+      calendarUrls: ["https://cal1.example.com/work"],
+      start: "2025-01-01T00:00:00Z",
+    })
+
+    expect(mockExtra.sendNotification).not.toHaveBeenCalled()
+  })
+
+  test("should return error listing unknown calendar URLs", async () => {
+    registerListEventsMulti(mockAccounts, mockServer)
+
+    const result = await registeredToolHandler({
+      calendarUrls: [
+        "https://cal1.example.com/work",
+        "https://cal1.example.com/nonexistent",
+      ],
+      start: "2025-01-01T00:00:00Z",
+    })
+
+    expect(result.isError).toBe(true)
+    expect(result.content[0].text).toContain(
+      "https://cal1.example.com/nonexistent",
+    )
+    expect(mockAccounts[0].client.getEvents).not.toHaveBeenCalled()
+  })
+
+  test("should handle CalDAV client errors gracefully", async () => {
+    mockAccounts[0].client.getEvents = vi.fn().mockResolvedValue([
+      {
+        uid: "work-1",
+        summary: "Team Meeting",
+        start: new Date("2025-01-15T10:00:00Z"),
+        end: new Date("2025-01-15T11:00:00Z"),
+      },
+    ])
+    mockAccounts[1].client.getEvents = vi
+      .fn()
+      .mockRejectedValue(new Error("CalDAV connection failed"))
+
+    registerListEventsMulti(mockAccounts, mockServer)
+
+    const result = await registeredToolHandler({
+      calendarUrls: [
+        "https://cal1.example.com/work",
+        "https://cal2.example.com/home",
+      ],
+      start: "2025-01-01T00:00:00Z",
+    })
+
+    expect(result.isError).toBeUndefined()
+    const responseData = JSON.parse(result.content[0].text)
+    expect(responseData).toHaveLength(1)
+    expect(responseData[0].calendarUrl).toBe("https://cal1.example.com/work")
+    expect(result.content[1].text).toContain(
+      "https://cal2.example.com/home: CalDAV connection failed",
+    )
+  })
+
+  test("should return error when every calendar fails", async () => {
+    mockAccounts[0].client.getEvents = vi
+      .fn()
+      .mockRejectedValue(new Error("Unauthorized"))
+    mockAccounts[1].client.getEvents = vi
+      .fn()
+      .mockRejectedValue(new Error("CalDAV connection failed"))
+
+    registerListEventsMulti(mockAccounts, mockServer)
+
+    const result = await registeredToolHandler({
+      calendarUrls: [
+        "https://cal1.example.com/work",
+        "https://cal2.example.com/home",
+      ],
+      start: "2025-01-01T00:00:00Z",
+    })
+
+    expect(result.isError).toBe(true)
+    expect(result.content[0].text).toContain(
+      "https://cal1.example.com/work: Unauthorized",
+    )
+    expect(result.content[0].text).toContain(
+      "https://cal2.example.com/home: CalDAV connection failed",
+    )
+  })
+})
@@ -0,0 +1,177 @@
+import { McpServer } from "@modelcontextprotocol/sdk/server/mcp.js"
+import { z } from "zod"
+import type { CalDAVAccount } from "../index.js"
+import { findAccountForCalendarUrl } from "../utils/accounts.js"
+import { getEventsCached } from "../utils/event-cache.js"
+import { expandRecurringEvents } from "../utils/recurrence.js"
+import type { ExpandedEvent } from "../utils/recurrence.js"
+import { DEFAULT_RANGE_MS, dateString, toEventSummary } from "./list-events.js"
+
+export function registerListEventsMulti(
+  accounts: CalDAVAccount[],
+  server: McpServer,
+) {
+  server.tool(
+    "list-events-multi",
+    "List all events between start and end date across several calendars specified by their URLs, fetching them in parallel. If end is not provided, defaults to 30 days after start. Recurring events are expanded to show actual occurrences within the date range.",
+    {
+      calendarUrls: z
+        .array(z.string())
+        .min(1)
+        .describe("Calendar URLs from list-calendars"),
+      start: dateString.describe(
+        "Start date in ISO 8601 format (e.g., 2025-11-27 or 2025-11-27T00:00:00Z)",
+      ),
+      end: dateString
+        .nullable()
+        .optional()
+        .describe(
+          "End date in ISO 8601 format. If not provided or null, defaults to 30 days after start",
+        ),
+    },
+    async ({ calendarUrls, start, end }, extra) => {
+      console.log(
+        `[list-events-multi] Request: calendarUrls=${JSON.stringify(calendarUrls)}, start="${start}", end="${end}"`,
+      )
+
+      const targets: Array<{ calendarUrl: string; account: CalDAVAccount }> =
+        []
+      const unknown: string[] = []
+      for (const calendarUrl of new Set(calendarUrls)) {
+        const account = findAccountForCalendarUrl(accounts, calendarUrl)
+        if (account) {
+          targets.push({ calendarUrl, account })
+        } else {
+          unknown.push(calendarUrl)
+        }
+      }
+
+      if (unknown.length > 0) {
+        console.log(
+          `[list-events-multi] ERROR: No account found for some calendar URLs`,
+        )
+        return {
+          content: [
+            {
+              type: "text",
+              text: `Error: No account found for calendar URLs: ${unknown.join(", ")}`,
+            },
+          ],
+          isError: true,
+        }
+      }
+
+      try {
+        const startDate = new Date(start)
+        const endDate = end
+          ? new Date(end)
+          : new Date(startDate.getTime() + DEFAULT_RANGE_MS)
+
+        const options = {
+          start: startDate,
+          end: endDate,
+        }
+
+        // Report each finished calendar so clients that asked for progress
+        // can follow long fan-outs before the merged result arrives
+        const progressToken = extra._meta?.progressToken
+        let completed = 0
+
+        // One failing calendar or account should not discard the events of
+        // the others, matching how accounts are connected at startup
+        const results = await Promise.allSettled(
+          targets.map(async ({ calendarUrl, account }) => {
+            try {
+              const events = await getEventsCached(
+                account,
+                calendarUrl,
+                options,
+              )
+              console.log(
+                `[list-events-multi] Found ${events.length} events in ${calendarUrl}`,
+              )
+
+              const expanded = expandRecurringEvents(events, startDate, endDate)
+              return expanded.map((event) => ({ calendarUrl, event }))
+            } finally {
+              completed++
+              if (progressToken !== undefined) {
+                // Best effort: a closed transport must not fail the listing
+                extra
+                  .sendNotification({
+                    method: "notifications/progress",
+                    params: {
+                      progressToken,
+                      progress: completed,
+                      total: targets.length,
+                    },
+                  })
+                  .catch((error) => {
+                    console.log(
+                      `[list-events-multi] Failed to send progress:`,
+                      error,
+                    )
+                  })
+              }
+            }
+          }),
+        )
+
+        const found: Array<{ calendarUrl: string; event: ExpandedEvent }> = []
+        const failures: string[] = []
+        results.forEach((result, i) => {
+          if (result.status === "fulfilled") {
+            found.push(...result.value)
+          } else {
+            const { calendarUrl } = targets[i]
+            const error = result.reason
+            console.log(`[list-events-multi] ERROR: ${calendarUrl}:`, error)
+            failures.push(
+              `${calendarUrl}: ${error instanceof Error ? error.message : String(error)}`,
+            )
+          }
+        })
+
+        if (failures.length === targets.length) {
+          return {
+            content: [
+              {
+                type: "text",
+                text: `Error fetching events: ${failures.join("; ")}`,
+              },
+            ],
+            isError: true,
+          }
+        }
+
+        const data = found
+          .sort((a, b) => a.event.start.getTime() - b.event.start.getTime())
+          .map(({ calendarUrl, event }) => ({
+            calendarUrl,
+            ...toEventSummary(event),
+          }))
+        const content = [
+          { type: "text" as const, text: JSON.stringify(data, null, 2) },
+        ]
+        if (failures.length > 0) {
+          content.push({
+            type: "text",
+            text: `Failed to fetch events for some calendars:\n${failures.join("\n")}`,
+          })
+        }
+        return { content }
+      } catch (error) {
+        console.log(`[list-events-multi] ERROR:`, error)
+        return {
+          content: [
+            {
+              type: "text",
+              text: `Error fetching events: ${error instanceof Error ? error.message : String(error)}`,
+            },
+          ],
+          isError: true,
+        }
+      }
+    },
+  )
+}
@@ -1,20 +1,42 @@
 import { McpServer } from "@modelcontextprotocol/sdk/server/mcp.js"
 import { z } from "zod"
 import type { CalDAVAccount } from "../index.js"
+import { findAccountForCalendarUrl } from "../utils/accounts.js"
+import { getEventsCached } from "../utils/event-cache.js"
 import { expandRecurringEvents } from "../utils/recurrence.js"
+import type { ExpandedEvent } from "../utils/recurrence.js"
 
-const dateString = z.string().refine((val) => !isNaN(Date.parse(val)), {
+// Default end is 30 days after start when not provided
+export const DEFAULT_RANGE_MS = 30 * 24 * 60 * 60 * 1000
+
+export const dateString = z.string().refine((val) => !isNaN(Date.parse(val)), {
   message:
     "Invalid date string. Use ISO 8601 format like 2025-11-27 or 2025-11-27T00:00:00Z",
 })
 
-function findAccountForCalendarUrl(
-  accounts: CalDAVAccount[],
-  calendarUrl: string,
-): CalDAVAccount | undefined {
-  return accounts.find((account) =>
-    account.calendars.some((c) => c.url === calendarUrl),
-  )
+export interface EventSummary {
+  summary: string
+  start: string
+  end: string
+  isRecurring: boolean
+  originalStart?: string
+  originalEventUid?: string
+}
+
+// Shared by the list tools. Fields are assigned in a fixed order so every
+// summary has the same shape, without spreading a temporary object per event.
+export function toEventSummary(e: ExpandedEvent): EventSummary {
+  const summary: EventSummary = {
+    summary: e.summary,
+    start: e.start.toISOString(),
+    end: e.end.toISOString(),
+    isRecurring: e.isRecurring,
+  }
+  if (e.isRecurring) {
+    summary.originalStart = e.originalStart?.toISOString()
+    summary.originalEventUid = e.originalEventUid
+  }
+  return summary
 }
 
 export function registerListEvents(
@@ -40,10 +62,6 @@ export function registerListEvents(
       console.log(
         `[list-events] Request: calendarUrl="${calendarUrl}", start="${start}", end="${end}"`,
       )
-      console.log(
-        `[list-events] Available calendars:`,
-        accounts.flatMap((a) => a.calendars.map((c) => `${a.name}: ${c.url}`)),
-      )
 
       const account = findAccountForCalendarUrl(accounts, calendarUrl)
       if (!account) {
@@ -63,10 +81,9 @@ export function registerListEvents(
 
       try {
         const startDate = new Date(start)
-        // Default end to 30 days after start if not provided
         const endDate = end
           ? new Date(end)
-          : new Date(startDate.getTime() + 30 * 24 * 60 * 60 * 1000)
+          : new Date(startDate.getTime() + DEFAULT_RANGE_MS)
 
         const options = {
           start: startDate,
@@ -74,7 +91,11 @@ export function registerListEvents(
         }
         console.log(`[list-events] Fetching events with options:`, options)
 
-        const allEvents = await account.client.getEvents(calendarUrl, options)
+        const allEvents = await getEventsCached(
+          account,
+          calendarUrl,
+          options,
+        )
         console.log(
           `[list-events] Found ${allEvents.length} events from CalDAV`,
         )
@@ -88,16 +109,7 @@ export function registerListEvents(
           `[list-events] Expanded to ${expandedEvents.length} event occurrences`,
         )
 
-        const data = expandedEvents.map((e) => ({
-          summary: e.summary,
-          start: e.start,
-          end: e.end,
-          isRecurring: e.isRecurring,
-          ...(e.isRecurring && {
-            originalStart: e.originalStart,
-            originalEventUid: e.originalEventUid,
-          }),
-        }))
+        const data = expandedEvents.map(toEventSummary)
         return {
           content: [{ type: "text", text: JSON.stringify(data, null, 2) }],
         }
@@ -0,0 +1,98 @@
+import { describe, test, expect } from "vitest"
+import { parseAccounts } from "./account-config.js"
+
+describe("parseAccounts", () => {
+  const account = (index: string, name = `Cal ${index}`) => ({
+    [`CALDAV_${index}_BASE_URL`]: `https://cal${index}.example.com`,
+    [`CALDAV_${index}_USERNAME`]: `user${index}`,
+    [`CALDAV_${index}_PASSWORD`]: `secret${index}`,
+    [`CALDAV_${index}_NAME`]: name,
+  })
+
+  test("should read every numbered account, including more than ten", () => {
+    const env = {}
+    for (let i = 1; i <= 12; i++) {
+      Object.assign(env, account(String(i)))
+    }
+
+    const accounts = parseAccounts(env)
+
+    expect(accounts).toHaveLength(12)
+    expect(accounts[11]).toEqual({
+      name: "Cal 12",
+      baseUrl: "https://cal12.example.com",
+      username: "user12",
+      password: "secret12",
+    })
+  })
+
+  test("should order accounts by their numeric index", () => {
+    const accounts = parseAccounts({
+      ...account("10"),
+      ...account("2"),
+      ...account("1"),
+    })
+
+    expect(accounts.map((a) => a.name)).toEqual(["Cal 1", "Cal 2", "Cal 10"])
+  })
+
+  test("should ignore zero and zero-padded indexes", () => {
+    const accounts = parseAccounts({
+      ...account("0"),
+      ...account("1"),
+      ...account("01", "Padded"),
+    })
+
+    expect(accounts.map((a) => a.name)).toEqual(["Cal 1"])
+  })
+
+  test("should skip accounts with missing fields", () => {
+    const incomplete = account("2")
+    delete incomplete.CALDAV_2_PASSWORD
+
+    const accounts = parseAccounts({ ...account("1"), ...incomplete })
+
+    expect(accounts.map((a) => a.name)).toEqual(["Cal 1"])
+  })
+
+  test("should default the name to the account index", () => {
+    const unnamed = account("3")
+    delete unnamed.CALDAV_3_NAME
+
+    const accounts = parseAccounts(unnamed)
+
+    expect(accounts[0].name).toBe("Account 3")
+  })
+
+  test("should fall back to the legacy single account variables", () => {
+    const accounts = parseAccounts({
+      CALDAV_BASE_URL: "https://legacy.example.com",
+      CALDAV_USERNAME: "legacy",
+      CALDAV_PASSWORD: "secret",
+    })
+
+    expect(accounts).toEqual([
+      {
+        name: "Default",
+        baseUrl: "https://legacy.example.com",
+        username: "legacy",
+        password: "secret",
+      },
+    ])
+  })
+
+  test("should ignore the legacy variables when numbered accounts exist", () => {
+    const accounts = parseAccounts({
+      ...account("1"),
+      CALDAV_BASE_URL: "https://legacy.example.com",
+      CALDAV_USERNAME: "legacy",
+      CALDAV_PASSWORD: "secret",
+    })
+
+    expect(accounts.map((a) => a.name)).toEqual(["Cal 1"])
+  })
+
+  test("should return no accounts when nothing is configured", () => {
+    expect(parseAccounts({})).toEqual([])
+  })
+})
@@ -0,0 +1,54 @@
+const ACCOUNT_ENV_PATTERN = /^CALDAV_([1-9]\d*)_(BASE_URL|USERNAME|PASSWORD|NAME)$/
+
+export interface AccountConfig {
+  name: string
+  baseUrl: string
+  username: string
+  password: string
+}
+
+export function parseAccounts(
+  env: NodeJS.ProcessEnv = process.env,
+): AccountConfig[] {
+  const accounts: AccountConfig[] = []
+
+  // Support numbered accounts: CALDAV_1_*, CALDAV_2_*, etc.
+  const numbered = new Map<number, Record<string, string | undefined>>()
+  for (const [key, value] of Object.entries(env)) {
+    const match = ACCOUNT_ENV_PATTERN.exec(key)
+    if (!match) continue
+
+    const index = parseInt(match[1], 10)
+    let fields = numbered.get(index)
+    if (!fields) {
+      fields = {}
+      numbered.set(index, fields)
+    }
+    fields[match[2]] = value
+  }
+
+  for (const [index, fields] of [...numbered].sort(([a], [b]) => a - b)) {
+    const baseUrl = fields.BASE_URL
+    const username = fields.USERNAME
+    const password = fields.PASSWORD
+    const name = fields.NAME || `Account ${index}`
+
+    if (baseUrl && username && password) {
+      accounts.push({ name, baseUrl, username, password })
+    }
+  }
+
+  // Fallback to legacy single account format
+  if (accounts.length === 0) {
+    const baseUrl = env.CALDAV_BASE_URL
+    const username = env.CALDAV_USERNAME
+    const password = env.CALDAV_PASSWORD
+    const name = env.CALDAV_NAME || "Default"
+
+    if (baseUrl && username && password) {
+      accounts.push({ name, baseUrl, username, password })
+    }
+  }
+
+  return accounts
+}
@@ -0,0 +1,63 @@
+/* eslint-disable @typescript-eslint/no-explicit-any */
+import { describe, test, expect } from "vitest"
+import { findAccountForCalendarUrl } from "./accounts.js"
+import type { CalDAVAccount } from "../index.js"
+
+describe("findAccountForCalendarUrl", () => {
+  const createAccounts = (): CalDAVAccount[] => [
+    {
+      name: "Work",
+      client: {} as any,
+      baseUrl: "https://cal1.example.com",
+      calendars: [
+        { name: "Team", url: "https://cal1.example.com/team/" },
+        { name: "Shared", url: "https://shared.example.com/cal/" },
+      ],
+    },
+    {
+      name: "Personal",
+      client: {} as any,
+      baseUrl: "https://cal2.example.com",
+      calendars: [
+        { name: "Home", url: "https://cal2.example.com/home/" },
+        { name: "Shared", url: "https://shared.example.com/cal/" },
+      ],
+    },
+  ]
+
+  test("should return the account owning the calendar URL", () => {
+    const accounts = createAccounts()
+
+    expect(
+      findAccountForCalendarUrl(accounts, "https://cal2.example.com/home/"),
+    ).toBe(accounts[1])
+  })
+
+  test("should return undefined for unknown calendar URLs", () => {
+    const accounts = createAccounts()
+
+    expect(
+      findAccountForCalendarUrl(accounts, "https://cal2.example.com/other/"),
+    ).toBeUndefined()
+  })
+
+  test("should prefer the first account when a URL is shared", () => {
+    const accounts = createAccounts()
+
+    expect(
+      findAccountForCalendarUrl(accounts, "https://shared.example.com/cal/"),
+    ).toBe(accounts[0])
+  })
+
+  test("should keep separate indexes per accounts list", () => {
+    const first = createAccounts()
+    const second = createAccounts().slice(1)
+
+    expect(
+      findAccountForCalendarUrl(first, "https://cal1.example.com/team/"),
+    ).toBe(first[0])
+    expect(
+      findAccountForCalendarUrl(second, "https://cal1.example.com/team/"),
+    ).toBeUndefined()
+  })
+})
@@ -0,0 +1,33 @@
+import type { CalDAVAccount } from "../index.js"
+
+// Calendar URL -> owning account, built once per accounts list
+const calendarIndexes = new WeakMap<
+  CalDAVAccount[],
+  Map<string, CalDAVAccount>
+>()
+
+function getCalendarIndex(
+  accounts: CalDAVAccount[],
+): Map<string, CalDAVAccount> {
+  let index = calendarIndexes.get(accounts)
+  if (!index) {
+    index = new Map()
+    for (const account of accounts) {
+      for (const cal of account.calendars) {
+        // First account wins, matching the previous linear search
+        if (!index.has(cal.url)) {
+          index.set(cal.url, account)
+        }
+      }
+    }
+    calendarIndexes.set(accounts, index)
+  }
+  return index
+}
+
+export function findAccountForCalendarUrl(
+  accounts: CalDAVAccount[],
+  calendarUrl: string,
+): CalDAVAccount | undefined {
+  return getCalendarIndex(accounts).get(calendarUrl)
+}
@@ -0,0 +1,72 @@
+import { describe, test, expect } from "vitest"
+import { ConcurrencyLimiter, parseMaxConcurrency } from "./concurrency.js"
+
+describe("ConcurrencyLimiter", () => {
+  const tick = () => new Promise((resolve) => setTimeout(resolve, 5))
+
+  test("should never run more tasks than the limit at once", async () => {
+    const limiter = new ConcurrencyLimiter(2)
+    let inFlight = 0
+    let maxInFlight = 0
+
+    const results = await Promise.all(
+      [1, 2, 3, 4, 5].map((n) =>
+        limiter.run(async () => {
+          inFlight++
+          maxInFlight = Math.max(maxInFlight, inFlight)
+          await tick()
+          inFlight--
+          return n * 10
+        }),
+      ),
+    )
+
+    expect(results).toEqual([10, 20, 30, 40, 50])
+    expect(maxInFlight).toBe(2)
+  })
+
+  test("should start queued tasks in arrival order", async () => {
+    const limiter = new ConcurrencyLimiter(1)
+    const started: number[] = []
+
+    await Promise.all(
+      [1, 2, 3].map((n) =>
+        limiter.run(async () => {
+          started.push(n)
+          await tick()
+        }),
+      ),
+    )
+
+    expect(started).toEqual([1, 2, 3])
+  })
+
+  test("should release the slot when a task fails", async () => {
+    const limiter = new ConcurrencyLimiter(1)
+
+    await expect(
+      limiter.run(async () => {
+        throw new Error("CalDAV connection failed")
+      }),
+    ).rejects.toThrow("CalDAV connection failed")
+    await expect(limiter.run(async () => "ok")).resolves.toBe("ok")
+  })
+})
+
+describe("parseMaxConcurrency", () => {
+  test("should default to 8 when unset or not a number", () => {
+    expect(parseMaxConcurrency(undefined)).toBe(8)
+    expect(parseMaxConcurrency("")).toBe(8)
+    expect(parseMaxConcurrency("many")).toBe(8)
+  })
+
+  test("should use the configured limit", () => {
+    expect(parseMaxConcurrency("3")).toBe(3)
+    expect(parseMaxConcurrency("16")).toBe(16)
+  })
+
+  test("should clamp limits below 1 to 1", () => {
+    expect(parseMaxConcurrency("0")).toBe(1)
+    expect(parseMaxConcurrency("-4")).toBe(1)
+  })
+})
@@ -0,0 +1,54 @@
+import type { CalDAVAccount } from "../index.js"
+
+const DEFAULT_MAX_CONCURRENCY = 8
+
+// Unset or non-numeric values use the default; anything below 1 becomes 1
+export function parseMaxConcurrency(value: string | undefined): number {
+  const parsed = parseInt(value ?? "", 10)
+  return Number.isNaN(parsed) ? DEFAULT_MAX_CONCURRENCY : Math.max(1, parsed)
+}
+
+const MAX_CONCURRENCY = parseMaxConcurrency(process.env.CALDAV_MAX_CONCURRENCY)
+
+export class ConcurrencyLimiter {
+  private active = 0
+  private waiting: Array<() => void> = []
+
+  constructor(private readonly limit: number) {}
+
+  async run<T>(task: () => Promise<T>): Promise<T> {
+    if (this.active < this.limit) {
+      this.active++
+    } else {
+      // The releasing task hands its slot over directly, so newcomers
+      // cannot overtake queued callers
+      await new Promise<void>((resolve) => this.waiting.push(resolve))
+    }
+
+    try {
+      return await task()
+    } finally {
+      const next = this.waiting.shift()
+      if (next) {
+        next()
+      } else {
+        this.active--
+      }
+    }
+  }
+}
+
+const limiters = new WeakMap<CalDAVAccount, ConcurrencyLimiter>()
+
+// Bound the number of in-flight requests against each CalDAV server
+export function withAccountLimit<T>(
+  account: CalDAVAccount,
+  task: () => Promise<T>,
+): Promise<T> {
+  let limiter = limiters.get(account)
+  if (!limiter) {
+    limiter = new ConcurrencyLimiter(MAX_CONCURRENCY)
+    limiters.set(account, limiter)
+  }
+  return limiter.run(task)
+}
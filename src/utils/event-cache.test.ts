@@ -0,0 +1,183 @@
+/* eslint-disable @typescript-eslint/no-explicit-any */
+import { describe, test, expect, vi, beforeEach, afterEach } from "vitest"
+import { getEventsCached, invalidateCalendar } from "./event-cache.js"
+import type { CalDAVAccount } from "../index.js"
+
+describe("getEventsCached", () => {
+  const calendarUrl = "https://caldav.example.com/calendars/test/calendar1"
+  const options = {
+    start: new Date("2025-01-01T00:00:00Z"),
+    end: new Date("2025-01-31T00:00:00Z"),
+  }
+  const otherRange = {
+    start: new Date("2025-02-01T00:00:00Z"),
+    end: new Date("2025-02-28T00:00:00Z"),
+  }
+  const events = [
+    {
+      uid: "event-1",
+      summary: "Team Meeting",
+      start: new Date("2025-01-15T10:00:00Z"),
+      end: new Date("2025-01-15T11:00:00Z"),
+    },
+  ]
+
+  let account: CalDAVAccount
+
+  const list = (range = options) =>
+    getEventsCached(account, calendarUrl, range)
+
+  beforeEach(() => {
+    vi.useFakeTimers()
+    account = {
+      name: "Test Account",
+      client: {
+        getEvents: vi.fn().mockResolvedValue(events),
+        getCtag: vi.fn().mockResolvedValue("ctag-1"),
+      } as any,
+      baseUrl: "https://caldav.example.com",
+      calendars: [{ name: "Test Calendar", url: calendarUrl }],
+    }
+  })
+
+  afterEach(() => {
+    vi.useRealTimers()
+  })
+
+  test("should read a CTag baseline before the first fetch of a calendar", async () => {
+    expect(await list()).toBe(events)
+
+    expect(account.client.getEvents).toHaveBeenCalledTimes(1)
+    expect(account.client.getCtag).toHaveBeenCalledTimes(1)
+    expect(
+      vi.mocked(account.client.getCtag).mock.invocationCallOrder[0],
+    ).toBeLessThan(
+      vi.mocked(account.client.getEvents).mock.invocationCallOrder[0],
+    )
+  })
+
+  test("should serve the first repeat of a request from cache", async () => {
+    await list()
+    expect(await list()).toBe(events)
+    expect(await list()).toBe(events)
+
+    expect(account.client.getEvents).toHaveBeenCalledTimes(1)
+    expect(account.client.getCtag).toHaveBeenCalledTimes(3)
+  })
+
+  test("should share a pending request between concurrent callers", async () => {
+    await Promise.all([list(), list()])
+
+    expect(account.client.getEvents).toHaveBeenCalledTimes(1)
+    expect(account.client.getCtag).toHaveBeenCalledTimes(1)
+  })
+
+  test("should refetch for a different range", async () => {
+    await list()
+    await list(otherRange)
+
+    expect(account.client.getEvents).toHaveBeenCalledTimes(2)
+  })
+
+  test("should reuse a known CTag for other ranges of the calendar", async () => {
+    await list()
+
+    // Cold miss on a new range: no extra PROPFIND
+    await list(otherRange)
+    expect(account.client.getCtag).toHaveBeenCalledTimes(1)
+    expect(account.client.getEvents).toHaveBeenCalledTimes(2)
+
+    // ...and its first repeat can already be served from cache
+    await list(otherRange)
+    expect(account.client.getEvents).toHaveBeenCalledTimes(2)
+  })
+
+  test("should share one CTag read between concurrent hits on one calendar", async () => {
+    await list()
+    await list(otherRange)
+    expect(account.client.getCtag).toHaveBeenCalledTimes(1)
+
+    await Promise.all([list(), list(otherRange)])
+
+    expect(account.client.getCtag).toHaveBeenCalledTimes(2)
+    expect(account.client.getEvents).toHaveBeenCalledTimes(2)
+  })
+
+  test("should revalidate expired entries when the CTag is unchanged", async () => {
+    await list()
+    vi.advanceTimersByTime(61 * 1000)
+    expect(await list()).toBe(events)
+    // Revalidation restarts the entry's TTL
+    vi.advanceTimersByTime(61 * 1000)
+    expect(await list()).toBe(events)
+
+    expect(account.client.getEvents).toHaveBeenCalledTimes(1)
+    expect(account.client.getCtag).toHaveBeenCalledTimes(3)
+  })
+
+  test("should refetch a fresh entry when the CTag changed", async () => {
+    account.client.getCtag = vi
+      .fn()
+      .mockResolvedValueOnce("ctag-1")
+      .mockResolvedValue("ctag-2")
+
+    await list()
+    await list()
+    expect(account.client.getEvents).toHaveBeenCalledTimes(2)
+
+    // The refetch stored the new CTag
+    await list()
+    expect(account.client.getEvents).toHaveBeenCalledTimes(2)
+  })
+
+  test("should fall back to the TTL when the CTag cannot be read", async () => {
+    account.client.getCtag = vi
+      .fn()
+      .mockRejectedValue(new Error("PROPFIND not supported"))
+
+    await list()
+    await list()
+    await list()
+    expect(account.client.getEvents).toHaveBeenCalledTimes(1)
+
+    vi.advanceTimersByTime(61 * 1000)
+    await list()
+
+    expect(account.client.getEvents).toHaveBeenCalledTimes(2)
+    // The failed read is remembered instead of repeated on every hit
+    expect(account.client.getCtag).toHaveBeenCalledTimes(1)
+  })
+
+  test("should refetch after the calendar is invalidated", async () => {
+    await list()
+    await list()
+    invalidateCalendar(account, calendarUrl)
+    await list()
+
+    expect(account.client.getEvents).toHaveBeenCalledTimes(2)
+    // The stored CTag is dropped too, so the refetch reads a new baseline
+    expect(account.client.getCtag).toHaveBeenCalledTimes(3)
+  })
+
+  test("should not cache failed requests", async () => {
+    account.client.getEvents = vi
+      .fn()
+      .mockRejectedValueOnce(new Error("CalDAV connection failed"))
+      .mockResolvedValueOnce(events)
+
+    await expect(list()).rejects.toThrow("CalDAV connection failed")
+    expect(await list()).toBe(events)
+  })
+
+  test("should keep caches separate per account", async () => {
+    const otherAccount: CalDAVAccount = {
+      ...account,
+      client: { getEvents: vi.fn().mockResolvedValue([]) } as any,
+    }
+
+    await list()
+    expect(await getEventsCached(otherAccount, calendarUrl, options)).toEqual(
+      [],
+    )
+  })
+})
@@ -0,0 +1,176 @@
+import type { Event } from "ts-caldav"
+import type { CalDAVAccount } from "../index.js"
+import { withAccountLimit } from "./concurrency.js"
+
+const CACHE_TTL_MS = 60 * 1000
+const MAX_ENTRIES = 128
+
+interface CacheEntry {
+  calendarUrl: string
+  // CTag read before the events were requested, if one was known
+  ctag?: string
+  events: Promise<Event[]>
+  fetchedAt: number
+  settled: boolean
+}
+
+interface CtagState {
+  value?: string
+  pending?: Promise<string | undefined>
+  // Set once a read fails; the calendar then relies on the TTL alone
+  unsupported?: boolean
+}
+
+interface AccountCache {
+  // LRU of getEvents results, keyed by calendar URL and range.
+  // Map iteration order doubles as recency order.
+  entries: Map<string, CacheEntry>
+  // Last CTag read per calendar, shared by all of its cached ranges
+  ctags: Map<string, CtagState>
+}
+
+const caches = new WeakMap<CalDAVAccount, AccountCache>()
+
+function getCache(account: CalDAVAccount): AccountCache {
+  let cache = caches.get(account)
+  if (!cache) {
+    cache = { entries: new Map(), ctags: new Map() }
+    caches.set(account, cache)
+  }
+  return cache
+}
+
+async function getCtag(
+  account: CalDAVAccount,
+  calendarUrl: string,
+): Promise<string | undefined> {
+  try {
+    return await withAccountLimit(account, () =>
+      account.client.getCtag(calendarUrl),
+    )
+  } catch {
+    // Without a CTag a cached entry is only served until its TTL runs out
+    return undefined
+  }
+}
+
+// Concurrent hits on ranges of the same calendar share one PROPFIND
+function readCtag(
+  account: CalDAVAccount,
+  cache: AccountCache,
+  calendarUrl: string,
+): Promise<string | undefined> {
+  let state = cache.ctags.get(calendarUrl)
+  if (!state) {
+    state = {}
+    cache.ctags.set(calendarUrl, state)
+  }
+  if (!state.pending) {
+    const current = state
+    current.pending = getCtag(account, calendarUrl).then((ctag) => {
+      current.value = ctag
+      current.unsupported = ctag === undefined
+      current.pending = undefined
+      return ctag
+    })
+  }
+  return state.pending
+}
+
+export async function getEventsCached(
+  account: CalDAVAccount,
+  calendarUrl: string,
+  options: { start: Date; end: Date },
+): Promise<Event[]> {
+  const cache = getCache(account)
+  const { entries } = cache
+  const key = `${calendarUrl}|${options.start.getTime()}|${options.end.getTime()}`
+
+  const state = cache.ctags.get(calendarUrl)
+  let ctag = state?.value
+
+  const cached = entries.get(key)
+  if (cached && !cached.settled) {
+    // Join a fetch that is still running; it is as fresh as a new one
+    return cached.events
+  }
+  if (cached) {
+    // Other clients may have changed the calendar in the meantime, so every
+    // hit is checked against its CTag. An unchanged CTag revalidates the
+    // entry however old it is; the TTL only bounds entries that cannot be
+    // checked. Calendars whose CTag could not be read are not asked again,
+    // so servers without getctag do not pay a failing PROPFIND per call.
+    if (!state?.unsupported) {
+      ctag = await readCtag(account, cache, calendarUrl)
+    }
+    // An invalidation while the CTag was read means our own write landed
+    const valid =
+      entries.get(key) === cached &&
+      (ctag !== undefined
+        ? ctag === cached.ctag
+        : Date.now() - cached.fetchedAt < CACHE_TTL_MS)
+    if (valid) {
+      if (ctag !== undefined) {
+        cached.fetchedAt = Date.now()
+      }
+      entries.delete(key)
+      entries.set(key, cached)
+      return cached.events
+    }
+  }
+
+  // The first fetch of a calendar records a CTag baseline so that its first
+  // repeat can already be served from cache; later cold misses reuse the
+  // known CTag rather than paying the extra round trip. Any CTag read before
+  // the events is safe to store: if it is outdated, the next hit sees a
+  // mismatch and refetches.
+  const ctagRead = cache.ctags.has(calendarUrl)
+    ? Promise.resolve(ctag)
+    : readCtag(account, cache, calendarUrl)
+  const entry: CacheEntry = {
+    calendarUrl,
+    events: ctagRead.then((baseline) => {
+      entry.ctag = baseline
+      return withAccountLimit(account, () =>
+        account.client.getEvents(calendarUrl, options),
+      )
+    }),
+    fetchedAt: Date.now(),
+    settled: false,
+  }
+  const markSettled = () => {
+    entry.settled = true
+  }
+  entry.events.then(markSettled, markSettled)
+  entries.delete(key)
+  entries.set(key, entry)
+  if (entries.size > MAX_ENTRIES) {
+    const oldest = entries.keys().next().value
+    if (oldest !== undefined) entries.delete(oldest)
+  }
+
+  try {
+    return await entry.events
+  } catch (error) {
+    if (entries.get(key) === entry) {
+      entries.delete(key)
+    }
+    throw error
+  }
+}
+
+export function invalidateCalendar(
+  account: CalDAVAccount,
+  calendarUrl: string,
+): void {
+  const cache = caches.get(account)
+  if (!cache) return
+
+  // Our own write changed the CTag too, so the stored one is outdated
+  cache.ctags.delete(calendarUrl)
+  for (const [key, entry] of cache.entries) {
+    if (entry.calendarUrl === calendarUrl) {
+      cache.entries.delete(key)
+    }
+  }
+}